@@ -1,11 +1,35 @@
 from collections import deque
-from typing import Deque, Generic, TypeVar
+from typing import Deque, Generic, List, Sequence, TypeVar
+import queue
 import threading
 import time
 from dataclasses import dataclass, field
 
 T = TypeVar('T')
 
+
+class _FastCondition(threading.Condition):
+    """Condition variable whose notify() wakes waiters in place.
+
+    Some CPython releases copy the waiters into a fresh deque on every
+    notify(); popping straight off the waiter deque avoids that allocation
+    on the put/get hot path. Only called by BlockingQueue with the lock
+    already held, so the ownership check is skipped.
+    """
+
+    def notify(self, n: int = 1) -> None:
+        """Wake up to n threads waiting on this condition."""
+        waiters = self._waiters
+        while waiters and n > 0:
+            waiter = waiters.popleft()
+            try:
+                waiter.release()
+            except RuntimeError:
+                # Already released by an interrupted notify(); skip it
+                continue
+            n -= 1
+
+
 @dataclass(kw_only=True)
 class BlockingQueue(Generic[T]):
     """Thread-safe bounded blocking queue implementation.
@@ -20,9 +44,13 @@ class BlockingQueue(Generic[T]):
     # Shared lock for thread synchronization
     _lock: threading.Lock = field(init=False, repr=False)
     # Condition variable for consumers waiting on empty queue
-    _not_empty: threading.Condition = field(init=False, repr=False)
+    _not_empty: _FastCondition = field(init=False, repr=False)
     # Condition variable for producers waiting on full queue
-    _not_full: threading.Condition = field(init=False, repr=False)
+    _not_full: _FastCondition = field(init=False, repr=False)
+    # Number of consumers currently blocked in _not_empty.wait()
+    _n_get_waiters: int = field(default=0, init=False, repr=False)
+    # Number of producers currently blocked in _not_full.wait()
+    _n_put_waiters: int = field(default=0, init=False, repr=False)
     
     def __post_init__(self) -> None:
         """Initialize queue with synchronization primitives."""
@@ -36,9 +64,67 @@ class BlockingQueue(Generic[T]):
         # Create shared lock for mutual exclusion
         self._lock = threading.Lock()
         
-        # Create condition variables sharing the same lock (monitor pattern)
-        self._not_empty = threading.Condition(self._lock)
-        self._not_full = threading.Condition(self._lock)
+        # Create condition variables sharing the same lock (monitor pattern).
+        # Kept separate, as in queue.Queue: with a single condition, notify()
+        # could wake a producer when only a consumer can make progress.
+        self._not_empty = _FastCondition(self._lock)
+        self._not_full = _FastCondition(self._lock)
+    
+    def _wait_not_full(self, end_time: float | None, caller: str) -> None:
+        """Block until the queue has a free slot. Lock must be held.
+        
+        Args:
+            end_time: Monotonic deadline (None = wait forever)
+            caller: Name of the calling method, for the timeout message
+            
+        Raises:
+            TimeoutError: If deadline passes before space available
+        """
+        # Wait while queue is full (use while to handle spurious wakeups)
+        while len(self._queue) >= self.max_size:
+            if end_time is None:
+                # Block indefinitely until space available
+                remaining = None
+            else:
+                # Calculate remaining time and wait with timeout
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"{caller}() timed out waiting for space in the queue")
+            
+            # Count ourselves so consumers know a notify() is needed
+            self._n_put_waiters += 1
+            try:
+                self._not_full.wait(timeout=remaining)
+            finally:
+                self._n_put_waiters -= 1
+    
+    def _wait_not_empty(self, end_time: float | None, caller: str) -> None:
+        """Block until the queue holds an item. Lock must be held.
+        
+        Args:
+            end_time: Monotonic deadline (None = wait forever)
+            caller: Name of the calling method, for the timeout message
+            
+        Raises:
+            TimeoutError: If deadline passes before item available
+        """
+        # Wait while queue is empty (use while to handle spurious wakeups)
+        while len(self._queue) == 0:
+            if end_time is None:
+                # Block indefinitely until item available
+                remaining = None
+            else:
+                # Calculate remaining time and wait with timeout
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"{caller}() timed out waiting for item")
+            
+            # Count ourselves so producers know a notify() is needed
+            self._n_get_waiters += 1
+            try:
+                self._not_empty.wait(timeout=remaining)
+            finally:
+                self._n_get_waiters -= 1
     
     def put(self, item: T, timeout: float | None = None) -> None:
         """Add item to queue, blocking if full.
@@ -50,28 +136,18 @@ class BlockingQueue(Generic[T]):
         Raises:
             TimeoutError: If timeout expires before space available
         """
-        with self._not_full:  # Acquire lock
-            # Calculate deadline if timeout specified
-            if timeout is not None:
-                end_time = time.monotonic() + timeout
-            
-            # Wait while queue is full (use while to handle spurious wakeups)
-            while len(self._queue) >= self.max_size:
-                if timeout is None:
-                    # Block indefinitely until space available
-                    self._not_full.wait()
-                else:
-                    # Calculate remaining time and wait with timeout
-                    remaining = end_time - time.monotonic()
-                    if remaining <= 0:
-                        raise TimeoutError("put() timed out waiting for space in the queue")
-                    self._not_full.wait(timeout=remaining)
+        with self._lock:
+            # Only touch the condition when the queue is actually full
+            if len(self._queue) >= self.max_size:
+                end_time = None if timeout is None else time.monotonic() + timeout
+                self._wait_not_full(end_time, "put")
             
             # Add item to queue
             self._queue.append(item)
             
-            # Wake one waiting consumer
-            self._not_empty.notify()
+            # Wake one waiting consumer, if any
+            if self._n_get_waiters:
+                self._not_empty.notify()
     
     def get(self, timeout: float | None = None) -> T:
         """Remove and return item from queue, blocking if empty.
@@ -85,34 +161,91 @@ class BlockingQueue(Generic[T]):
         Raises:
             TimeoutError: If timeout expires before item available
         """
-        with self._not_empty:  # Acquire lock
-            # Calculate deadline if timeout specified
-            if timeout is not None:
-                end_time = time.monotonic() + timeout
-            
-            # Wait while queue is empty (use while to handle spurious wakeups)
-            while len(self._queue) == 0:
-                if timeout is None:
-                    # Block indefinitely until item available
-                    self._not_empty.wait()
-                else:
-                    # Calculate remaining time and wait with timeout
-                    remaining = end_time - time.monotonic()
-                    if remaining <= 0:
-                        raise TimeoutError("get() timed out waiting for item")
-                    self._not_empty.wait(timeout=remaining)
+        with self._lock:
+            # Only touch the condition when the queue is actually empty
+            if len(self._queue) == 0:
+                end_time = None if timeout is None else time.monotonic() + timeout
+                self._wait_not_empty(end_time, "get")
             
             # Remove and return item from front of queue
             item = self._queue.popleft()
             
-            # Wake one waiting producer
-            self._not_full.notify()
+            # Wake one waiting producer, if any
+            if self._n_put_waiters:
+                self._not_full.notify()
             return item
 
+    def put_many(self, items: Sequence[T], timeout: float | None = None) -> None:
+        """Add a batch of items to queue, blocking while full.
+
+        Takes the lock once per stretch of free space rather than once
+        per item, and wakes as many consumers as items were added.
+
+        Args:
+            items: Items to add to queue, in order
+            timeout: Optional timeout in seconds (None = wait forever)
+
+        Raises:
+            TimeoutError: If timeout expires before all items are added.
+                Items added before the timeout stay in the queue.
+        """
+        with self._lock:
+            # Calculate deadline if timeout specified
+            end_time = None if timeout is None else time.monotonic() + timeout
+
+            start = 0
+            while start < len(items):
+                self._wait_not_full(end_time, "put_many")
+
+                # Fill all free slots in one go
+                take = min(self.max_size - len(self._queue), len(items) - start)
+                self._queue.extend(items[start:start + take])
+                start += take
+
+                # Wake one waiting consumer per added item, if any
+                if self._n_get_waiters:
+                    self._not_empty.notify(take)
+
+    def get_many(self, max_items: int, timeout: float | None = None) -> List[T]:
+        """Remove and return up to max_items items, blocking while empty.
+
+        Waits for at least one item, then drains whatever is available
+        up to max_items without waiting further.
+
+        Args:
+            max_items: Maximum number of items to return
+            timeout: Optional timeout in seconds (None = wait forever)
+
+        Returns:
+            Items from front of queue, in FIFO order
+
+        Raises:
+            ValueError: If max_items is not positive
+            TimeoutError: If timeout expires before any item available
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+
+        with self._lock:
+            if len(self._queue) == 0:
+                end_time = None if timeout is None else time.monotonic() + timeout
+                self._wait_not_empty(end_time, "get_many")
+
+            # Drain up to max_items from front of queue
+            popleft = self._queue.popleft
+            items = [popleft() for _ in range(min(max_items, len(self._queue)))]
+
+            # Wake one waiting producer per freed slot, if any
+            if self._n_put_waiters:
+                self._not_full.notify(len(items))
+            return items
+
+    # len() on a deque is a single atomic C call under the GIL, so the
+    # observers below read it without taking the lock.
+
     def size(self) -> int:
         """Return current number of items in queue (thread-safe)."""
-        with self._lock:
-            return len(self._queue)
+        return len(self._queue)
     
     def capacity(self) -> int:
         """Return maximum capacity of queue."""
@@ -120,10 +253,91 @@ class BlockingQueue(Generic[T]):
     
     def is_empty(self) -> bool:
         """Check if queue is empty (thread-safe)."""
-        with self._lock:
-            return len(self._queue) == 0
+        return len(self._queue) == 0
     
     def is_full(self) -> bool:
         """Check if queue is full (thread-safe)."""
-        with self._lock:
-            return len(self._queue) >= self.max_size
+        return len(self._queue) >= self.max_size
+
+
+@dataclass(kw_only=True)
+class UnboundedQueue(Generic[T]):
+    """Thread-safe unbounded queue backed by queue.SimpleQueue.
+    
+    Offers the same put/get interface as BlockingQueue for pipelines that
+    need no backpressure. SimpleQueue is implemented in C and its put()
+    never blocks, so there is no not-full condition to maintain.
+    """
+    # Internal C-implemented FIFO
+    _queue: "queue.SimpleQueue[T]" = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Initialize empty queue."""
+        self._queue = queue.SimpleQueue()
+    
+    def put(self, item: T, timeout: float | None = None) -> None:
+        """Add item to queue. Never blocks; timeout is accepted for
+        interface compatibility with BlockingQueue and ignored."""
+        self._queue.put(item)
+    
+    def get(self, timeout: float | None = None) -> T:
+        """Remove and return item from queue, blocking if empty.
+        
+        Args:
+            timeout: Optional timeout in seconds (None = wait forever)
+            
+        Returns:
+            Item from front of queue
+            
+        Raises:
+            TimeoutError: If timeout expires before item available
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("get() timed out waiting for item") from None
+    
+    def put_many(self, items: Sequence[T], timeout: float | None = None) -> None:
+        """Add a batch of items to queue. Never blocks."""
+        put = self._queue.put
+        for item in items:
+            put(item)
+    
+    def get_many(self, max_items: int, timeout: float | None = None) -> List[T]:
+        """Remove and return up to max_items items, blocking while empty.
+        
+        Args:
+            max_items: Maximum number of items to return
+            timeout: Optional timeout in seconds (None = wait forever)
+            
+        Returns:
+            Items from front of queue, in FIFO order
+            
+        Raises:
+            ValueError: If max_items is not positive
+            TimeoutError: If timeout expires before any item available
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+        
+        try:
+            items = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            raise TimeoutError("get_many() timed out waiting for item") from None
+        
+        # Drain whatever else is already there without waiting
+        get_nowait = self._queue.get_nowait
+        try:
+            while len(items) < max_items:
+                items.append(get_nowait())
+        except queue.Empty:
+            pass
+        return items
+    
+    def size(self) -> int:
+        """Return approximate number of items in queue."""
+        return self._queue.qsize()
+    
+    def is_empty(self) -> bool:
+        """Check if queue is empty."""
+        return self._queue.empty()
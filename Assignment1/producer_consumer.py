@@ -1,97 +1,175 @@
+import operator
 import threading
 from dataclasses import dataclass, field
-from typing import Generic, Iterable, List, TypeVar, cast
-from .blocking_queue import BlockingQueue
+from itertools import compress, count, repeat
+from typing import Any, Callable, Generic, Iterable, List, TypeVar, cast
+from .blocking_queue import BlockingQueue, UnboundedQueue
 
 import time
 
-# Generic type variable for type-safe producer-consumer
+# Generic type variables for type-safe producer-consumer
 T = TypeVar("T")
+R = TypeVar("R")
 
 # Unique sentinel object to signal end of data stream
 SENTINEL = object()
 
+# Number of items moved per queue operation
+BATCH_SIZE = 64
+
 @dataclass(kw_only=True, eq=False)
 class Producer(threading.Thread, Generic[T]):
     """Producer thread that reads from source and pushes to queue.
     
     Continuously reads items from source iterable and places them into
-    the shared blocking queue. Always sends sentinel on completion,
-    even if an exception occurs.
+    the shared blocking queue in batches. Stops reading early once stop
+    is set. Always sends sentinel on completion, even if an exception
+    occurs.
     """
     source: Iterable[T]  # Data source to read from
-    queue: BlockingQueue[object]  # Shared queue to write to
+    queue: BlockingQueue[object] | UnboundedQueue[object]  # Shared queue to write to
     sentinel: object = SENTINEL  # Stop signal for consumer
+    stop: threading.Event = field(default_factory=threading.Event)  # Set when consumer fails
+    batch_size: int = BATCH_SIZE  # Items handed to the queue per put_many()
     name: str = "producer"  # Thread name for debugging
     
     def __post_init__(self) -> None:
         """Initialize thread after dataclass initialization."""
+        # Validate batch size before the thread can start
+        if self.batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
         threading.Thread.__init__(self, name=self.name)
     
     def run(self) -> None:
         """Main producer logic: read from source, write to queue."""
+        batch: List[object] = []
         try:
-            # Iterate through source and push each item to queue
+            # Collect items from source and push each full batch to queue.
+            # A partial batch goes out as soon as the queue runs empty, so
+            # a slow source never leaves the consumer waiting on a batch.
             for item in self.source:
-                self.queue.put(item)  # Blocks if queue is full
+                batch.append(item)
+                if len(batch) >= self.batch_size or self.queue.is_empty():
+                    self.queue.put_many(batch)  # Blocks while queue is full
+                    batch = []
+                    # Consumer gave up: stop reading, go straight to the sentinel
+                    if self.stop.is_set():
+                        break
         finally:
-            # Always send sentinel to signal consumer to stop
+            # Always flush the partial batch followed by the sentinel
             # This ensures clean shutdown even if exception occurs
-            self.queue.put(self.sentinel)
+            batch.append(self.sentinel)
+            self.queue.put_many(batch)
 
 
 @dataclass(kw_only=True, eq=False)
 class Consumer(threading.Thread, Generic[T]):
     """Consumer thread that reads from queue and writes to destination.
     
-    Continuously pulls items from the shared blocking queue and appends
-    them to the destination list. Stops when sentinel is received.
+    Continuously pulls batches from the shared blocking queue, applies the
+    optional transform, and appends the results to the destination list.
+    Stops when sentinel is received. Since it drains in batches, it
+    expects to be the queue's only consumer.
     """
-    queue: BlockingQueue[object]  # Shared queue to read from
+    queue: BlockingQueue[object] | UnboundedQueue[object]  # Shared queue to read from
     destination: List[T] = field(default_factory=list)  # Where to store items
+    transform: Callable[[Any], T] | None = None  # Applied to each item, if set
     sentinel: object = SENTINEL  # Stop signal from producer
+    stop: threading.Event = field(default_factory=threading.Event)  # Set on failure
+    batch_size: int = BATCH_SIZE  # Max items taken per get_many()
     name: str = "consumer"  # Thread name for debugging
+    error: Exception | None = field(default=None, init=False)  # Raised by transform
     
     def __post_init__(self) -> None:
         """Initialize thread after dataclass initialization."""
+        # Validate batch size before the thread can start
+        if self.batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
         threading.Thread.__init__(self, name=self.name)
         
     def run(self) -> None:
         """Main consumer logic: read from queue, write to destination."""
-        while True:
-            # Pull item from queue (blocks if queue is empty)
-            item = self.queue.get()
-            
-            # Check if this is the stop signal
-            if item is self.sentinel:
-                break  # Exit loop and terminate thread
-            
+        batch: List[object] = []
+        try:
+            while True:
+                # Pull a batch from queue (blocks if queue is empty)
+                batch = self.queue.get_many(self.batch_size)
+                
+                # Check for the stop signal
+                index = self._find_sentinel(batch)
+                if index >= 0:
+                    # Keep items ahead of it, then terminate thread
+                    self._store(batch[:index])
+                    return
+                
+                self._store(batch)
+        except Exception as exc:
+            # Record the failure, tell the producer to stop reading, and
+            # keep draining up to the sentinel so it never blocks forever
+            # on a full queue
+            self.error = exc
+            self.stop.set()
+            while self._find_sentinel(batch) < 0:
+                batch = self.queue.get_many(self.batch_size)
+
+    def _find_sentinel(self, batch: List[object]) -> int:
+        """Return the index of the sentinel in batch, or -1 if absent."""
+        # Identity test via map/compress keeps the scan in C, with no
+        # Python-level loop per item (list.index would call __eq__)
+        hits = compress(count(), map(operator.is_, batch, repeat(self.sentinel)))
+        return next(hits, -1)
+
+    def _store(self, batch: List[object]) -> None:
+        """Append a batch to destination, transforming it if requested."""
+        if self.transform is None:
             # Cast to correct type and append to destination
-            value = cast(T, item)
-            self.destination.append(value)
+            self.destination.extend(cast(List[T], batch))
+        else:
+            self.destination.extend(map(self.transform, batch))
 
 
-def run_pipeline(source: Iterable[T], queue_size: int=10) -> List[T]:
+def run_pipeline(source: Iterable[T], queue_size: int=10,
+                 transform: Callable[[T], R] | None = None) -> List[T] | List[R]:
     """Orchestrate producer-consumer pipeline.
     
     Creates shared queue, starts producer and consumer threads,
     waits for completion, and returns collected results.
     
+    Without a transform there is no work for the threads to overlap, and
+    under the GIL shovelling items through a queue is strictly slower
+    than copying them, so the source is materialized directly instead.
+    
     Args:
         source: Iterable data source for producer
-        queue_size: Maximum capacity of shared queue
+        queue_size: Maximum capacity of shared queue (0 or less = unbounded)
+        transform: Optional callable applied to each item by the consumer
         
     Returns:
         List of items transferred through pipeline
+        
+    Raises:
+        Exception: Whatever transform raised, once both threads have stopped
     """
-    # Create shared blocking queue
-    queue: BlockingQueue[object] = BlockingQueue(max_size=queue_size)
+    # Identity pipeline: skip the threads entirely
+    if transform is None:
+        return list(source)
+
+    # Create shared queue; without a bound there is no backpressure to
+    # enforce, so use the C-backed queue that never blocks on put
+    queue: BlockingQueue[object] | UnboundedQueue[object]
+    if queue_size <= 0:
+        queue = UnboundedQueue()
+    else:
+        queue = BlockingQueue(max_size=queue_size)
     # Create destination list for results
-    destination: List[T] = []
+    destination: List[R] = []
 
-    # Create producer and consumer threads
-    producer: Producer[T] = Producer(source=source, queue=queue, sentinel=SENTINEL)
-    consumer: Consumer[T] = Consumer(queue=queue, destination=destination, sentinel=SENTINEL)
+    # Create producer and consumer threads; a failing consumer sets stop
+    # so the producer quits reading instead of exhausting the source
+    stop = threading.Event()
+    producer: Producer[T] = Producer(source=source, queue=queue, sentinel=SENTINEL, stop=stop)
+    consumer: Consumer[R] = Consumer(queue=queue, destination=destination,
+                                     sentinel=SENTINEL, transform=transform, stop=stop)
 
     # Start both threads concurrently
     producer.start()
@@ -101,6 +179,10 @@ def run_pipeline(source: Iterable[T], queue_size: int=10) -> List[T]:
     producer.join()  # Wait for producer to finish
     consumer.join()  # Wait for consumer to finish
 
+    # Surface a failing transform to the caller
+    if consumer.error is not None:
+        raise consumer.error
+
     # Return collected results
     return destination
 
@@ -110,8 +192,9 @@ if __name__ == "__main__":  # pragma: no cover - to ignore main module for incre
     source = [1, 2, 3, 4, 5]
 
     print("Running producer–consumer pipeline...")
-    # Run pipeline with small queue to demonstrate blocking
-    result = run_pipeline(source, queue_size=3)
+    # A transform makes the pipeline run its threads; the small queue
+    # makes the producer block until the consumer catches up
+    result = run_pipeline(source, queue_size=3, transform=lambda x: x * 10)
 
     # Display results
     print("\n=== Pipeline Summary ===")
@@ -7,7 +7,7 @@ import unittest
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT))
 
-from Assignment1.blocking_queue import BlockingQueue
+from Assignment1.blocking_queue import BlockingQueue, UnboundedQueue
 
 
 class TestBlockingQueue(unittest.TestCase):
@@ -87,6 +87,67 @@ class TestBlockingQueue(unittest.TestCase):
         self.assertEqual(queue.get(), 20)
         self.assertTrue(queue.is_empty())
     
+    def test_queue_wakes_each_blocked_consumer(self) -> None:
+        queue: BlockingQueue[int] = BlockingQueue(max_size=3)
+        result: list[int] = []
+
+        def consumer() -> None:
+            result.append(queue.get(timeout=1.0))
+
+        threads = [threading.Thread(target=consumer) for _ in range(3)]
+        for t in threads:
+            t.start()
+
+        time.sleep(0.05)
+        for item in (1, 2, 3):
+            queue.put(item)
+
+        for t in threads:
+            t.join(timeout=1.0)
+        self.assertEqual(sorted(result), [1, 2, 3])
+        self.assertTrue(queue.is_empty())
+
+    def test_put_many_and_get_many_basic(self) -> None:
+        queue = BlockingQueue[int](max_size=5)
+        queue.put_many([1, 2, 3])
+        self.assertEqual(queue.size(), 3)
+
+        self.assertEqual(queue.get_many(2), [1, 2])
+        self.assertEqual(queue.get_many(10), [3])
+        self.assertTrue(queue.is_empty())
+
+    def test_put_many_blocks_when_batch_exceeds_capacity(self) -> None:
+        queue: BlockingQueue[int] = BlockingQueue(max_size=2)
+        result: list[int] = []
+
+        def consumer() -> None:
+            while len(result) < 5:
+                result.extend(queue.get_many(2, timeout=1.0))
+
+        t = threading.Thread(target=consumer)
+        t.start()
+
+        queue.put_many([1, 2, 3, 4, 5], timeout=1.0)
+        t.join(timeout=1.0)
+
+        self.assertEqual(result, [1, 2, 3, 4, 5])
+        self.assertTrue(queue.is_empty())
+
+    def test_put_many_timeout_keeps_items_already_added(self) -> None:
+        queue: BlockingQueue[int] = BlockingQueue(max_size=2)
+
+        with self.assertRaises(TimeoutError):
+            queue.put_many([1, 2, 3], timeout=0.1)
+        self.assertEqual(queue.get_many(5), [1, 2])
+
+    def test_get_many_timeout_and_invalid_size(self) -> None:
+        queue: BlockingQueue[int] = BlockingQueue(max_size=2)
+
+        with self.assertRaises(TimeoutError):
+            queue.get_many(2, timeout=0.1)
+        with self.assertRaises(ValueError):
+            queue.get_many(0)
+
     def test_put_timeout_raises_error(self) -> None:
         queue: BlockingQueue[int] = BlockingQueue(max_size=1)
         queue.put(1)
@@ -131,6 +192,29 @@ class TestBlockingQueue(unittest.TestCase):
         
         self.assertEqual(result, 42)
 
+    def test_unbounded_queue_put_and_get(self) -> None:
+        queue: UnboundedQueue[int] = UnboundedQueue()
+        self.assertTrue(queue.is_empty())
+        
+        queue.put(1)
+        queue.put_many(list(range(2, 201)))
+        self.assertEqual(queue.size(), 200)
+        
+        self.assertEqual(queue.get(), 1)
+        self.assertEqual(queue.get_many(3), [2, 3, 4])
+        self.assertEqual(queue.get_many(500), list(range(5, 201)))
+        self.assertTrue(queue.is_empty())
+    
+    def test_unbounded_queue_timeouts_and_invalid_size(self) -> None:
+        queue: UnboundedQueue[int] = UnboundedQueue()
+        
+        with self.assertRaises(TimeoutError):
+            queue.get(timeout=0.1)
+        with self.assertRaises(TimeoutError):
+            queue.get_many(2, timeout=0.1)
+        with self.assertRaises(ValueError):
+            queue.get_many(0)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,4 +1,7 @@
+import itertools
 import sys
+import threading
+import time
 from pathlib import Path
 import unittest
 
@@ -23,6 +26,13 @@ class TestProducerConsumer(unittest.TestCase):
         self.assertEqual(consumer.destination, [])
         self.assertIs(consumer.sentinel, SENTINEL)
     
+    def test_rejects_invalid_batch_size(self) -> None:
+        queue: BlockingQueue = BlockingQueue(max_size=5)
+        with self.assertRaises(ValueError):
+            Producer(source=[1], queue=queue, batch_size=0)
+        with self.assertRaises(ValueError):
+            Consumer(queue=queue, batch_size=-1)
+    
     def test_producer_enqueues_items_and_sentinel(self) -> None:
         queue: BlockingQueue[object] = BlockingQueue(max_size=5)
         source = [1, 2, 3]
@@ -66,6 +76,20 @@ class TestProducerConsumer(unittest.TestCase):
         result = run_pipeline(source, queue_size=2)
         self.assertEqual(result, [1, None, 3])
     
+    def test_run_pipeline_threaded_round_trip(self) -> None:
+        # An identity transform forces the producer/consumer threads
+        source = [1, 2, 3, 4, 5]
+        result = run_pipeline(source, queue_size=2, transform=lambda x: x)
+        self.assertEqual(result, source)
+    
+    def test_run_pipeline_threaded_handles_empty_source(self) -> None:
+        result = run_pipeline([], queue_size=3, transform=lambda x: x)
+        self.assertEqual(result, [])
+    
+    def test_run_pipeline_threaded_preserves_none_values(self) -> None:
+        result = run_pipeline([1, None, 3], queue_size=2, transform=lambda x: x)
+        self.assertEqual(result, [1, None, 3])
+    
     def test_producer_sends_sentinel_on_exception(self) -> None:
         queue: BlockingQueue[object] = BlockingQueue(max_size=5)
         
@@ -87,6 +111,74 @@ class TestProducerConsumer(unittest.TestCase):
         result = run_pipeline(source, queue_size=5)
         self.assertEqual(result, source)
     
+    def test_run_pipeline_spans_multiple_batches(self) -> None:
+        source = list(range(1000))
+        result = run_pipeline(source, queue_size=7, transform=lambda x: x + 1)
+        self.assertEqual(result, [x + 1 for x in source])
+    
+    def test_run_pipeline_consumes_slow_source_without_waiting_for_batch(self) -> None:
+        start = time.perf_counter()
+        seen_at: list[float] = []
+        
+        def slow_source():
+            for item in range(3):
+                time.sleep(0.2)
+                yield item
+        
+        def record(value: int) -> int:
+            seen_at.append(time.perf_counter() - start)
+            return value
+        
+        result = run_pipeline(slow_source(), queue_size=10, transform=record)
+        self.assertEqual(result, [0, 1, 2])
+        # The first item is transformed while the source is still producing
+        self.assertLess(seen_at[0], 0.5)
+    
+    def test_run_pipeline_unbounded_queue(self) -> None:
+        source = list(range(500))
+        result = run_pipeline(source, queue_size=0, transform=str)
+        self.assertEqual(result, [str(x) for x in source])
+    
+    def test_run_pipeline_applies_transform(self) -> None:
+        result = run_pipeline(["a", None, "c"], queue_size=2, transform=repr)
+        self.assertEqual(result, ["'a'", "None", "'c'"])
+    
+    def test_run_pipeline_identity_accepts_generator(self) -> None:
+        result = run_pipeline((x * 2 for x in range(5)))
+        self.assertEqual(result, [0, 2, 4, 6, 8])
+    
+    def test_run_pipeline_raises_transform_error(self) -> None:
+        def failing_transform(value: int) -> int:
+            if value == 50:
+                raise ValueError("bad item")
+            return value
+        
+        # Small queue forces the producer to block until the consumer drains it
+        with self.assertRaises(ValueError):
+            run_pipeline(range(200), queue_size=2, transform=failing_transform)
+
+    def test_run_pipeline_transform_error_stops_endless_source(self) -> None:
+        def failing_transform(value: int) -> int:
+            if value == 3:
+                raise ValueError("bad item")
+            return value
+        
+        errors: list[Exception] = []
+        
+        def run() -> None:
+            try:
+                run_pipeline(itertools.count(), queue_size=4, transform=failing_transform)
+            except ValueError as exc:
+                errors.append(exc)
+        
+        # The producer must stop reading the endless source once the consumer fails
+        t = threading.Thread(target=run, daemon=True)
+        t.start()
+        t.join(timeout=2.0)
+        
+        self.assertFalse(t.is_alive())
+        self.assertEqual(len(errors), 1)
+
     def test_consumer_with_custom_destination(self) -> None:
         queue: BlockingQueue[object] = BlockingQueue(max_size=5)
         custom_dest: list[str] = []
@@ -101,6 +193,23 @@ class TestProducerConsumer(unittest.TestCase):
         
         self.assertEqual(custom_dest, ["a", "b"])
     
+    def test_consumer_matches_sentinel_by_identity_only(self) -> None:
+        class NoEquality:
+            def __eq__(self, other: object) -> bool:
+                raise AssertionError("sentinel must be compared with 'is'")
+        
+        queue: BlockingQueue[object] = BlockingQueue(max_size=5)
+        item = NoEquality()
+        queue.put_many([item, item, SENTINEL])
+        
+        consumer: Consumer[NoEquality] = Consumer(queue=queue)
+        consumer.start()
+        consumer.join(timeout=1.0)
+        
+        self.assertIsNone(consumer.error)
+        self.assertEqual(len(consumer.destination), 2)
+        self.assertIs(consumer.destination[0], item)
+    
     def test_main_block_execution(self) -> None:
         import sys
         from io import StringIO
@@ -111,11 +220,11 @@ class TestProducerConsumer(unittest.TestCase):
         
         try:
             # Execute the main block code
-            sample_data = [1, 2, 3, None, 5]
-            result = run_pipeline(sample_data, queue_size=3)
+            sample_data = [1, 2, 3, 4, 5]
+            result = run_pipeline(sample_data, queue_size=3, transform=lambda x: x * 10)
             
             # Verify result
-            self.assertEqual(result, [1, 2, 3, None, 5])
+            self.assertEqual(result, [10, 20, 30, 40, 50])
             self.assertEqual(len(result), 5)
         finally:
             sys.stdout = old_stdout
@@ -3,125 +3,174 @@ Advanced Sales Data Analyzer using Functional Programming Paradigms
 Demonstrates stream operations, lambda expressions, and data aggregation
 """
 
+import numpy as np
 import pandas as pd
-from functools import reduce
+from functools import cached_property, reduce
 from typing import Dict, List, Tuple, Any
 import operator
-from .sales_reader import read_sales_data
-from .sales_model import SalesRecord
+from .sales_reader import CsvSource, read_sales_dataframe
+
+# Price bands: Budget < 100 <= Mid-range < 500 <= Premium
+_PRICE_RANGES = ['Budget', 'Mid-range', 'Premium']
+# Lower edge of every band after the first
+_PRICE_EDGES = np.array([100.0, 500.0])
+# Date format used by the sales CSV
+_DATE_FORMAT = '%Y-%m-%d'
+
+
+def _price_bands(prices: np.ndarray) -> np.ndarray:
+    """Index into _PRICE_RANGES for every price.
+
+    A binary search over the band edges, run in C over the whole array;
+    side='right' puts a price equal to an edge in the higher band.
+    """
+    return np.searchsorted(_PRICE_EDGES, prices, side='right')
 
 
 class SalesAnalyzer:
     """Functional programming approach to sales data analysis"""
     
-    def __init__(self, csv_file: str):
-        records = read_sales_data(csv_file)
-        if records:
-            data_dict = {
-                'product_id': [r.product_id for r in records],
-                'product_name': [r.product_name for r in records],
-                'category': [r.category for r in records],
-                'price': [r.price for r in records],
-                'quantity': [r.quantity for r in records],
-                'sales_date': [r.sales_date for r in records],
-                'region': [r.region for r in records],
-                'total_revenue': [r.total_value for r in records]
-            }
-            self.data = pd.DataFrame(data_dict)
-            self.data['sales_date'] = pd.to_datetime(self.data['sales_date'])
-        else:
-            self.data = pd.DataFrame(columns=['product_id', 'product_name', 'category', 
-                                            'price', 'quantity', 'sales_date', 'region', 
-                                            'total_revenue'])
+    def __init__(self, csv_file: CsvSource, backend: str = 'pandas'):
+        # backend only selects the CSV parser; analysis always runs on pandas
+        self.data = read_sales_dataframe(csv_file, backend=backend)
+        # An explicit format skips per-value format inference
+        self.data['sales_date'] = pd.to_datetime(self.data['sales_date'], format=_DATE_FORMAT,
+                                                 cache=True)
+        # One multiply over the raw NumPy buffers, no index alignment
+        self.data['total_revenue'] = self.data['price'].to_numpy() * self.data['quantity'].to_numpy()
+        # Low-cardinality labels: group on integer codes, not string hashes
+        self.data = self.data.astype({'product_name': 'category', 'category': 'category',
+                                      'region': 'category'})
+    
+    # Groupings below are computed on first use and reused by every later
+    # call; they assume self.data is not modified after construction.
+    # observed=True keeps categorical groupings to labels actually present.
+    
+    @cached_property
+    def _revenue_by_product(self) -> pd.Series:
+        """Total revenue per product name"""
+        return self.data.groupby('product_name', sort=False, observed=True)['total_revenue'].sum()
+    
+    @cached_property
+    def _revenue_by_category(self) -> pd.Series:
+        """Total revenue per category"""
+        return self.data.groupby('category', sort=False, observed=True)['total_revenue'].sum()
+    
+    @cached_property
+    def _daily_totals(self) -> pd.DataFrame:
+        """Sale count and revenue per calendar day, in date order"""
+        return (self.data.groupby(self.data['sales_date'].dt.date)
+                .agg({'product_id': 'count', 'total_revenue': 'sum'}))
+    
+    @cached_property
+    def _monthly_totals(self) -> pd.DataFrame:
+        """Revenue and units sold per YYYY-MM month, in month order"""
+        return (self.data.groupby(self.data['sales_date'].dt.strftime('%Y-%m'))
+                .agg({'total_revenue': 'sum', 'quantity': 'sum'}))
+    
+    @cached_property
+    def _regional_totals(self) -> pd.DataFrame:
+        """Revenue totals, order stats and best category per region"""
+        totals = (self.data.groupby('region', observed=True)['total_revenue']
+                  .agg(total_sales='sum', avg_order_value='mean', product_count='count'))
+        # One two-level groupby instead of a sub-groupby per region
+        top_category = (self.data.groupby(['region', 'category'], observed=True)['total_revenue']
+                        .sum()
+                        .groupby(level='region')
+                        .idxmax()
+                        .map(lambda key: key[1]))
+        return totals.assign(top_category=top_category)
+    
+    @cached_property
+    def _revenue_by_weekday(self) -> pd.Series:
+        """Total revenue per weekday name"""
+        return (self.data.groupby(self.data['sales_date'].dt.day_name(), sort=False)
+                ['total_revenue'].sum())
+    
+    @cached_property
+    def _by_date(self) -> pd.DataFrame:
+        """Rows sorted by sale date (undated rows last), for range lookups"""
+        return self.data.sort_values('sales_date', kind='stable')
     
     def top_products_by_revenue(self, n: int = 5) -> List[Tuple[str, float]]:
         """Stream-based aggregation of top products by revenue"""
         if len(self.data) == 0:
             return []
-        return (self.data.groupby('product_name')['total_revenue']
-                .sum()
-                .pipe(lambda x: x.sort_values(ascending=False))
-                .head(n)
+        # Heap-select the top n instead of sorting every product
+        return (self._revenue_by_product
+                .nlargest(n)
                 .pipe(lambda x: list(zip(x.index, x.values))))
     
     def revenue_by_category(self) -> Dict[str, float]:
         """Functional aggregation using reduce and lambda"""
         if len(self.data) == 0:
             return {}
-        category_revenues = self.data.groupby('category')['total_revenue'].sum()
-        return dict(zip(category_revenues.index, category_revenues.values))
+        return self._revenue_by_category.to_dict()
     
     def daily_sales_performance(self) -> List[Tuple[str, int, float]]:
         """Date-based performance analysis with functional operations"""
         if len(self.data) == 0:
             return []
-        return (self.data.groupby(self.data['sales_date'].dt.date)
-                .agg({'product_id': 'count', 'total_revenue': 'sum'})
-                .pipe(lambda df: [(str(idx), row['product_id'], row['total_revenue']) 
-                                for idx, row in df.iterrows()]))
+        return (self._daily_totals
+                .pipe(lambda df: list(zip(map(str, df.index),
+                                          df['product_id'].tolist(),
+                                          df['total_revenue'].tolist()))))
     
     def regional_analysis(self) -> Dict[str, Dict[str, Any]]:
         """Nested functional operations for regional insights"""
         if len(self.data) == 0:
             return {}
-        return (self.data.groupby('region')
-                .apply(lambda group: {
-                    'total_sales': group['total_revenue'].sum(),
-                    'avg_order_value': group['total_revenue'].mean(),
-                    'product_count': len(group),
-                    'top_category': group.groupby('category')['total_revenue']
-                                   .sum().idxmax()
-                }, include_groups=False)
-                .to_dict())
+        return self._regional_totals.to_dict(orient='index')
     
     def price_distribution_analysis(self) -> Dict[str, List[Tuple[str, int]]]:
         """Stream operations with custom lambda functions"""
+        distribution: Dict[str, List[Tuple[str, int]]] = {name: [] for name in _PRICE_RANGES}
         if len(self.data) == 0:
-            return {'Budget': [], 'Mid-range': [], 'Premium': []}
+            return distribution
         
-        price_ranges = [
-            ('Budget', lambda x: x < 100),
-            ('Mid-range', lambda x: 100 <= x < 500),
-            ('Premium', lambda x: x >= 500)
-        ]
+        # Band every row in one vectorized pass, then count
+        # (band, category) pairs with a single groupby
+        bands = _price_bands(self.data['price'].to_numpy())
+        counts = self.data.groupby([bands, 'category'], observed=True).size()
         
-        return {
-            range_name: list(
-                self.data[self.data['price'].apply(condition)]
-                .groupby('category')
-                .size()
-                .pipe(lambda x: zip(x.index, x.values))
-            )
-            for range_name, condition in price_ranges
-        }
+        for (band, category), count in zip(counts.index, counts.tolist()):
+            distribution[_PRICE_RANGES[band]].append((category, count))
+        return distribution
     
     def monthly_trend_analysis(self) -> List[Tuple[str, float, int]]:
         """Time-based aggregation using functional approach"""
         if len(self.data) == 0:
             return []
-        return (self.data.groupby(self.data['sales_date'].dt.strftime('%Y-%m'))
-                .agg({'total_revenue': 'sum', 'quantity': 'sum'})
-                .pipe(lambda df: [(idx, row['total_revenue'], row['quantity']) 
-                                for idx, row in df.iterrows()]))
+        return (self._monthly_totals
+                .pipe(lambda df: list(zip(df.index.tolist(),
+                                          df['total_revenue'].tolist(),
+                                          df['quantity'].tolist()))))
     
     def weekly_sales_pattern(self) -> Dict[str, float]:
         """Weekly pattern analysis using lambda expressions"""
         if len(self.data) == 0:
             return {}
-        return (self.data.groupby(self.data['sales_date'].dt.day_name())['total_revenue']
-                .sum()
-                .pipe(lambda x: dict(zip(x.index, x.values))))
+        return self._revenue_by_weekday.to_dict()
     
     def date_range_analysis(self, start_date: str = None, end_date: str = None) -> Dict[str, Any]:
         """Complex date filtering with lambda expressions"""
         if len(self.data) == 0:
             return {'filtered_sales': 0, 'avg_daily_revenue': 0.0, 'peak_day': None}
         
-        filtered_data = self.data
+        # Both bounds are inclusive: binary-search them in the sorted dates
+        # instead of scanning every row with a boolean mask
+        dates = self._by_date['sales_date'].to_numpy()
+        start = 0
         if start_date:
-            filtered_data = filtered_data[filtered_data['sales_date'] >= start_date]
+            start = dates.searchsorted(pd.Timestamp(start_date).to_datetime64(), side='left')
         if end_date:
-            filtered_data = filtered_data[filtered_data['sales_date'] <= end_date]
+            end = dates.searchsorted(pd.Timestamp(end_date).to_datetime64(), side='right')
+        elif start_date:
+            # Undated (NaT) rows sort last and never match a date bound
+            end = dates.searchsorted(np.datetime64('NaT'), side='left')
+        else:
+            end = len(dates)
+        filtered_data = self._by_date.iloc[start:end]
         
         if len(filtered_data) == 0:
             return {'filtered_sales': 0, 'avg_daily_revenue': 0.0, 'peak_day': None}
@@ -139,11 +188,11 @@ class SalesAnalyzer:
         """Multi-dimensional analysis using functional programming"""
         if len(self.data) == 0:
             return []
-        return (self.data.groupby(['category', 'region'])['total_revenue']
+        return (self.data.groupby(['category', 'region'], observed=True)['total_revenue']
                 .sum()
-                .reset_index()
-                .pipe(lambda df: [(row['category'], row['region'], row['total_revenue']) 
-                                for _, row in df.iterrows()]))
+                .pipe(lambda x: list(zip(x.index.get_level_values('category').tolist(),
+                                         x.index.get_level_values('region').tolist(),
+                                         x.tolist()))))
 
 
 def main():
@@ -4,13 +4,17 @@ Data model for the sales CSV dataset.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SalesRecord:
-    """In-memory representation of a single sales row."""
+    """In-memory representation of a single sales row.
+
+    Slotted, so each record is a fixed layout with no per-instance __dict__.
+    """
 
     product_id: int
     product_name: str
@@ -19,11 +23,13 @@ class SalesRecord:
     quantity: int
     sales_date: str
     region: str
+    # Total sales value for this record, fixed at construction
+    total_value: float = field(init=False)
 
-    @property
-    def total_value(self) -> float:
-        """Total sales value for this record."""
-        return self.price * self.quantity
+    def __post_init__(self) -> None:
+        """Compute total_value once instead of on every access."""
+        # Frozen dataclass: bypass the generated __setattr__
+        object.__setattr__(self, "total_value", self.price * self.quantity)
 
     @staticmethod
     def _to_int(value: Any, default: int = 0) -> int:
@@ -43,13 +49,17 @@ class SalesRecord:
 
     @classmethod
     def from_row(cls, row: Dict[str, Any]) -> "SalesRecord":
-        """Build a SalesRecord from a CSV DictReader row."""
+        """Build a SalesRecord from a CSV DictReader row.
+
+        Repeated labels (name, category, region) are interned so records
+        share one string object per distinct value.
+        """
         return cls(
             product_id=cls._to_int(row.get("product_id")),
-            product_name=str(row.get("product_name", "")),
-            category=str(row.get("category", "")),
+            product_name=sys.intern(str(row.get("product_name", ""))),
+            category=sys.intern(str(row.get("category", ""))),
             price=cls._to_float(row.get("price")),
             quantity=cls._to_int(row.get("quantity")),
             sales_date=str(row.get("sales_date", "")),
-            region=str(row.get("region", "")),
+            region=sys.intern(str(row.get("region", ""))),
         )
\ No newline at end of file
@@ -1,11 +1,32 @@
-import csv
+import os
+import sys
+from dataclasses import fields
 from pathlib import Path
-from typing import List
+from typing import IO, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
 from .sales_model import SalesRecord
 
+# CSV columns, in SalesRecord field order (derived fields excluded)
+SALES_COLUMNS = [f.name for f in fields(SalesRecord) if f.init]
+# Columns coerced to numbers: storage dtype and the same fallback as SalesRecord.
+# Counts and ids are stored as int32 when every value fits, else int64;
+# money stays float64 so sums keep their cents.
+_NUMERIC_COLUMNS = {'product_id': ('int32', 0), 'price': ('float64', 0.0), 'quantity': ('int32', 0)}
+# Columns kept verbatim as text
+_TEXT_COLUMNS = [column for column in SALES_COLUMNS if column not in _NUMERIC_COLUMNS]
+# Repeated labels, interned by read_sales_data as SalesRecord.from_row does
+_LABEL_COLUMNS = ('product_name', 'category', 'region')
+
+# A CSV path, or an already-open stream such as io.StringIO or io.BytesIO
+# (bytes are decoded as UTF-8)
+CsvSource = Union[str, "os.PathLike[str]", IO[str], IO[bytes]]
 
-def read_sales_data(csv_path: str) -> List[SalesRecord]:
-    """Read sales data from CSV file."""
+
+def _resolve_path(csv_path: Union[str, "os.PathLike[str]"]) -> Path:
+    """Resolve a CSV path and make sure it exists."""
     # If the path is not absolute, resolve it relative to this script's directory
     path = Path(csv_path)
     if not path.is_absolute():
@@ -14,15 +35,125 @@ def read_sales_data(csv_path: str) -> List[SalesRecord]:
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {path}")
 
-    records = []
+    return path
+
+
+def read_sales_data(csv_path: CsvSource) -> List[SalesRecord]:
+    """Read sales data from CSV file or stream.
+
+    Labels are interned so records share one string object per distinct
+    name, category and region.
+    """
+    data = read_sales_dataframe(csv_path)
+    # Columns are already in SalesRecord field order
+    columns = [data[column].tolist() for column in SALES_COLUMNS]
+    for position, column in enumerate(SALES_COLUMNS):
+        if column in _LABEL_COLUMNS:
+            columns[position] = list(map(sys.intern, columns[position]))
+    return [SalesRecord(*row) for row in zip(*columns)]
+
+
+def _parse_with_pandas(source: CsvSource) -> Optional[pd.DataFrame]:
+    """Parse CSV with pandas' C reader; None for a completely empty file."""
+    try:
+        # Selecting the known columns with index_col=False makes pandas drop
+        # the extra fields of overlong rows. Without it an overlong first row
+        # turns column 0 into the index and shifts every column by one.
+        # Text columns skip type inference; only empty numeric cells become NaN
+        return pd.read_csv(source, encoding='utf-8',
+                           usecols=lambda column: column in SALES_COLUMNS, index_col=False,
+                           dtype={column: str for column in _TEXT_COLUMNS},
+                           keep_default_na=False,
+                           na_values={column: [''] for column in _NUMERIC_COLUMNS})
+    except pd.errors.EmptyDataError:
+        return None
+
+
+def _parse_with_polars(source: CsvSource) -> Optional[pd.DataFrame]:
+    """Parse CSV with polars' multi-threaded reader; None for an empty file.
+
+    Numeric columns are stripped of padding and cast to float natively,
+    with unparseable cells left null, so the shared coercion in
+    read_sales_dataframe only has to fill defaults and cast. Everything
+    else stays text. Overlong rows are truncated and blank lines dropped,
+    as with the pandas backend; polars cannot tell a line of bare
+    separators from a blank line, so that is dropped too.
+    """
+    try:
+        import polars as pl
+    except ImportError as exc:
+        raise ImportError("backend='polars' requires the polars and pyarrow packages") from exc
+
+    try:
+        frame = pl.read_csv(source, infer_schema=False, truncate_ragged_lines=True)
+    except pl.exceptions.NoDataError:
+        return None
+
+    # Blank (or whitespace-only) lines come back with every field after
+    # the first missing and a blank first field
+    first, *rest = frame.columns
+    blank = pl.col(first).str.strip_chars().fill_null('') == ''
+    if rest:
+        blank = blank & pl.all_horizontal(pl.col(rest).is_null())
+    numeric = [column for column in frame.columns if column in _NUMERIC_COLUMNS]
+    frame = frame.filter(~blank).with_columns(
+        pl.col(numeric).str.strip_chars().cast(pl.Float64, strict=False))
+    return frame.to_pandas()
+
+
+_PARSERS = {'pandas': _parse_with_pandas, 'polars': _parse_with_polars}
+
+
+def _coerce_numeric(values: pd.Series, dtype: str, default: float) -> pd.Series:
+    """Convert a column to numbers, with default for unparseable cells.
+
+    Integer columns also send non-integral values ('2.5', 'inf') to the
+    default, as SalesRecord._to_int does; integral decimals such as '2.0'
+    are read as 2. They are widened to int64 instead of silently wrapping
+    when a value does not fit the narrow dtype, and values beyond int64
+    get the default like any other unusable cell.
+    """
+    numbers = pd.to_numeric(values, errors='coerce').fillna(default)
+    if np.issubdtype(dtype, np.integer):
+        # Float bounds: to_numeric yields float64 or uint64 past int64
+        usable = (np.isfinite(numbers) & (numbers == numbers.round())
+                  & (numbers >= -2.0 ** 63) & (numbers < 2.0 ** 63))
+        numbers = numbers.where(usable, default)
+        limits = np.iinfo(dtype)
+        if numbers.min() < limits.min or numbers.max() > limits.max:
+            dtype = 'int64'
+    return numbers.astype(dtype)
+
+
+def read_sales_dataframe(csv_path: CsvSource, backend: str = 'pandas') -> pd.DataFrame:
+    """Read sales data from CSV file or stream straight into a DataFrame.
+
+    Parses with a columnar CSV reader instead of building a SalesRecord per
+    row. Unparseable numbers fall back to 0, as in SalesRecord. Rows with
+    too many fields keep their first fields and drop the rest, as
+    csv.DictReader did. Streams are read as-is, so callers can skip the
+    filesystem entirely.
+
+    backend picks the parser: 'pandas' (default) or 'polars', an optional
+    dependency whose multi-threaded parser is faster on large files (about
+    2x on a million rows). Either way the result is the same pandas
+    DataFrame.
+    """
+    if backend not in _PARSERS:
+        raise ValueError(f"Unknown backend {backend!r}; expected one of {sorted(_PARSERS)}")
+
+    if isinstance(csv_path, (str, os.PathLike)):
+        source = _resolve_path(csv_path)
+    else:
+        source = csv_path
 
-    with open(path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            try:
-                record = SalesRecord.from_row(row)
-                records.append(record)
-            except (ValueError, KeyError):
-                continue  # Skip malformed rows
+    data = _PARSERS[backend](source)
+    if data is None:
+        return pd.DataFrame(columns=SALES_COLUMNS)
 
-    return records
\ No newline at end of file
+    data = data.reindex(columns=SALES_COLUMNS)
+    for column, (dtype, default) in _NUMERIC_COLUMNS.items():
+        data[column] = _coerce_numeric(data[column], dtype, default)
+    # Short rows leave trailing cells missing; treat them as empty text
+    data[_TEXT_COLUMNS] = data[_TEXT_COLUMNS].fillna('')
+    return data
@@ -0,0 +1,9 @@
+"""
+pytest configuration for the Assignment2 tests.
+
+pandas and numpy are imported here, at collection time, so their one-off
+import cost is paid before the first test runs instead of inside it.
+"""
+
+import numpy  # noqa: F401
+import pandas  # noqa: F401
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Run every Assignment2 test module in a single suite, so pandas and the
+analyzer are imported once per run. From the repository root:
+
+    python3 -m Assignment2.tests.run_all
+"""
+
+import sys
+import unittest
+
+TEST_MODULES = [
+    'Assignment2.tests.test_components',
+    'Assignment2.tests.test_sales_analyzer',
+]
+
+
+def main() -> int:
+    suite = unittest.TestLoader().loadTestsFromNames(TEST_MODULES)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 
+import importlib.util
+import io
 import unittest
-import tempfile
-import os
 from Assignment2.sales_model import SalesRecord
-from Assignment2.sales_reader import read_sales_data
+from Assignment2.sales_reader import read_sales_data, read_sales_dataframe
 
 class TestComponents(unittest.TestCase):
     
@@ -21,6 +21,40 @@ class TestComponents(unittest.TestCase):
         # Test valid conversions
         self.assertEqual(SalesRecord._to_int("123"), 123)
         self.assertEqual(SalesRecord._to_float("99.99"), 99.99)
+        self.assertEqual(SalesRecord._to_int("-7"), -7)
+        self.assertEqual(SalesRecord._to_float("-1.5"), -1.5)
+        self.assertEqual(SalesRecord._to_float("12"), 12.0)
+        self.assertEqual(SalesRecord._to_float("1.2.3"), 0.0)
+    
+    def test_sales_model_conversions_accept_any_input(self):
+        """Test unhashable inputs fall back to the default instead of raising"""
+        self.assertEqual(SalesRecord._to_int([1]), 0)
+        self.assertEqual(SalesRecord._to_float({"price": 1}), 0.0)
+    
+    def test_sales_model_total_value(self):
+        """Test total_value is computed at construction"""
+        record = SalesRecord(1, 'Desk', 'Furniture', 150.0, 3, '2024-01-01', 'North')
+        self.assertEqual(record.total_value, 450.0)
+        self.assertNotIsInstance(getattr(SalesRecord, 'total_value', None), property)
+        self.assertFalse(hasattr(record, '__dict__'))
+    
+    def test_sales_model_interns_labels(self):
+        """Test from_row shares one string object per repeated label"""
+        rows = [{"category": "".join(["Elec", "tronics"]), "region": "North"} for _ in range(2)]
+        first, second = (SalesRecord.from_row(row) for row in rows)
+        self.assertIsNot(rows[0]["category"], rows[1]["category"])
+        self.assertIs(first.category, second.category)
+    
+    def test_sales_reader_interns_labels(self):
+        """Test read_sales_data shares one string object per repeated label"""
+        data = """product_id,product_name,category,price,quantity,sales_date,region
+1,Desk,Furniture,150.00,3,2024-01-01,North
+2,Desk,Furniture,20.00,1,2024-01-02,North"""
+        
+        first, second = read_sales_data(io.StringIO(data))
+        self.assertIs(first.product_name, second.product_name)
+        self.assertIs(first.category, second.category)
+        self.assertIs(first.region, second.region)
     
     def test_sales_reader_file_not_found(self):
         """Test sales reader file not found error"""
@@ -32,17 +66,100 @@ class TestComponents(unittest.TestCase):
         malformed_data = """product_id,product_name,category,price,quantity,sales_date,region
 ,,,invalid,invalid,,"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(malformed_data)
-            f.flush()
-            
-            records = read_sales_data(f.name)
-            # Should create record with default values due to error handling
-            self.assertEqual(len(records), 1)
-            self.assertEqual(records[0].price, 0.0)
-            self.assertEqual(records[0].quantity, 0)
-            
-            os.remove(f.name)
+        records = read_sales_data(io.StringIO(malformed_data))
+        # Should create record with default values due to error handling
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].price, 0.0)
+        self.assertEqual(records[0].quantity, 0)
+    
+    def test_sales_dataframe_malformed_data(self):
+        """Test DataFrame reader falls back like SalesRecord on bad values"""
+        malformed_data = """product_id,product_name,category,price,quantity,sales_date,region
+1,Desk,Furniture,invalid,3,2024-01-01,North
+,,,,invalid,,"""
+        
+        data = read_sales_dataframe(io.StringIO(malformed_data))
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data['price'].tolist(), [0.0, 0.0])
+        self.assertEqual(data['quantity'].tolist(), [3, 0])
+        self.assertEqual(data['product_name'].tolist(), ['Desk', ''])
+    
+    def test_sales_reader_fractional_counts_fall_back(self):
+        """Test non-integral quantities get the default, as in SalesRecord._to_int"""
+        data = """product_id,product_name,category,price,quantity,sales_date,region
+1,Desk,Furniture,150.00,2.5,2024-01-01,North
+2,Lamp,Furniture,20.00,inf,2024-01-02,South
+3,Rug,Furniture,40.00,2.0,2024-01-03,East"""
+        
+        records = read_sales_data(io.StringIO(data))
+        self.assertEqual([record.quantity for record in records], [0, 0, 2])
+        self.assertEqual(records[0].quantity, SalesRecord._to_int("2.5"))
+    
+    def test_sales_dataframe_widens_out_of_range_ids(self):
+        """Test ids too large for int32 are kept, and beyond int64 fall back"""
+        data = """product_id,product_name,category,price,quantity,sales_date,region
+3000000000,Desk,Furniture,150.00,3,2024-01-01,North
+1,Lamp,Furniture,20.00,1,2024-01-02,South"""
+        
+        frame = read_sales_dataframe(io.StringIO(data))
+        self.assertEqual(frame['product_id'].tolist(), [3000000000, 1])
+        self.assertEqual(frame['product_id'].dtype, 'int64')
+        self.assertEqual(frame['quantity'].dtype, 'int32')
+        
+        huge = """product_id,product_name,category,price,quantity,sales_date,region
+99999999999999999999,Desk,Furniture,150.00,9223372036854775808,2024-01-01,North
+9000000000000000000,Lamp,Furniture,20.00,1,2024-01-02,South"""
+        
+        frame = read_sales_dataframe(io.StringIO(huge))
+        self.assertEqual(frame['product_id'].tolist(), [0, 9000000000000000000])
+        self.assertEqual(frame['quantity'].tolist(), [0, 1])
+    
+    def test_sales_reader_keeps_text_and_truncates_long_rows(self):
+        """Test reader keeps numeric-looking names as text and drops extra fields"""
+        data = """product_id,product_name,category,price,quantity,sales_date,region
+1,123,Electronics,9.50,2,2024-01-01,North
+2,Lamp,Furniture,1,1,2024-01-02,South,extra"""
+        
+        records = read_sales_data(io.StringIO(data))
+        self.assertEqual(records, [SalesRecord(1, '123', 'Electronics', 9.5, 2, '2024-01-01', 'North'),
+                                   SalesRecord(2, 'Lamp', 'Furniture', 1.0, 1, '2024-01-02', 'South')])
+    
+    def test_sales_reader_long_first_row_keeps_columns_aligned(self):
+        """Test an overlong first row does not shift every column by one"""
+        data = """product_id,product_name,category,price,quantity,sales_date,region
+1,A,Electronics,100,1,2024-01-03,North,extra
+2,B,Furniture,50,2,2024-01-04,South"""
+        
+        records = read_sales_data(io.StringIO(data))
+        self.assertEqual(records, [SalesRecord(1, 'A', 'Electronics', 100.0, 1, '2024-01-03', 'North'),
+                                   SalesRecord(2, 'B', 'Furniture', 50.0, 2, '2024-01-04', 'South')])
+    
+    def test_sales_dataframe_unknown_backend(self):
+        """Test DataFrame reader rejects an unknown backend"""
+        with self.assertRaises(ValueError):
+            read_sales_dataframe(io.StringIO(""), backend='spark')
+    
+    @unittest.skipUnless(importlib.util.find_spec("polars") and importlib.util.find_spec("pyarrow"),
+                         "polars backend needs polars and pyarrow")
+    def test_sales_dataframe_polars_matches_pandas(self):
+        """Test the polars backend yields the same frame as pandas"""
+        data = """product_id,product_name,category,price,quantity,sales_date,region
+1,123,Electronics,9.50,2,2024-01-01,North,extra
+2,Lamp,Furniture,invalid,,2024-01-02,South
+3,Desk,Furniture,150.00,3
+3000000000,NA,,inf,2.5,2024-01-03,East
+
+5,Rug,Furniture,40.00,2.0,2024-01-04,West,x,y
+ 6 ,Mat,Furniture, 12.50 , 7 ,2024-01-05,North
+
+"""
+        
+        expected = read_sales_dataframe(io.StringIO(data))
+        actual = read_sales_dataframe(io.StringIO(data), backend='polars')
+        self.assertTrue(actual.equals(expected), f"\n{actual}\n!=\n{expected}")
+        self.assertEqual(len(actual), 6)
+        self.assertEqual(actual['quantity'].iloc[-1], 7)
+        self.assertEqual(len(read_sales_dataframe(io.StringIO(''), backend='polars')), 0)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
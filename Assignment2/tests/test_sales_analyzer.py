@@ -3,147 +3,153 @@ Comprehensive unit tests for SalesAnalyzer
 Tests all functional programming methods and edge cases
 """
 
+import io
 import sys
-from pathlib import Path
 import unittest
 import tempfile
 import os
 
-# Add parent directory to path for imports
-REPO_ROOT = Path(__file__).resolve().parent
-sys.path.insert(0, str(REPO_ROOT))
+import pandas as pd
 
 from Assignment2.sales_analyzer import SalesAnalyzer
 
-
-class TestSalesAnalyzer(unittest.TestCase):
-    
-    def setUp(self):
-        """Create sample CSV data for testing"""
-        self.sample_data_content = """product_id,product_name,category,price,quantity,sales_date,region
+# Shared 4-row fixture, as UTF-8 bytes so it can be fed to io.BytesIO or
+# os.write without an encode step
+_SAMPLE_CSV = b"""product_id,product_name,category,price,quantity,sales_date,region
 1,Test Product A,Electronics,100.00,2,2024-01-01,North
 2,Test Product B,Furniture,200.00,1,2024-01-02,South
 3,Test Product C,Electronics,50.00,3,2024-01-03,East
 4,Test Product D,Furniture,300.00,1,2024-01-04,West"""
+
+
+class _CappedIO(io.StringIO):
+    """StringIO that keeps only the first 4 KB written to it"""
+    
+    LIMIT = 4096
+    
+    def write(self, s):
+        if self.tell() < self.LIMIT:
+            super().write(s)
+        return len(s)
+
+
+class TestSalesAnalyzerRO(unittest.TestCase):
+    """Read-only tests sharing one analyzer; safe to run in parallel"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create a shared analyzer from the sample CSV, once per class.
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(self.sample_data_content)
-            self.sample_file = f.name
+        Tests in this class only read from the analyzer, so they can all
+        share it. The CSV is handed over in memory; only
+        test_initialization_from_file_path touches the filesystem.
+        """
+        cls.analyzer = SalesAnalyzer(io.BytesIO(_SAMPLE_CSV))
+        # Snapshot checked in tearDownClass: the fixture must stay read-only
+        cls._orig = cls.analyzer.data.copy()
+        # Column names as a set, for O(1) membership checks
+        cls.cols = frozenset(cls.analyzer.data.columns)
         
-        self.analyzer = SalesAnalyzer(self.sample_file)
+        # Hand-computed category revenue oracle:
+        # Electronics: (100*2) + (50*3) = 200 + 150 = 350
+        # Furniture: (200*1) + (300*1) = 200 + 300 = 500
+        cls.expected_cat = {'Electronics': 200.00 + 150.00, 'Furniture': 200.00 + 300.00}
+        
+        # Results shared by several tests, computed once.
+        # NOTE: these are plain dicts; mutating them in one test breaks the others.
+        cls.regional = cls.analyzer.regional_analysis()
+        cls.weekly = cls.analyzer.weekly_sales_pattern()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Fail loudly if any test modified the shared analyzer's data"""
+        if not cls.analyzer.data.equals(cls._orig):
+            raise AssertionError("shared SalesAnalyzer fixture was mutated by a test")
+    
+    def setUp(self):
+        """Track temp files created by this test"""
+        self._tmp_paths = set()
     
     def tearDown(self):
-        """Clean up temporary files"""
+        """Remove only the temp files this test created"""
+        for path in self._tmp_paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+    
+    def _write_temp_csv(self, content):
+        """Write CSV bytes to a temp file, registered for cleanup in tearDown"""
+        # Write straight to the raw fd, skipping the text-file object layer
+        fd, path = tempfile.mkstemp(suffix='.csv')
         try:
-            os.remove(self.sample_file)
-        except:
-            pass
-        
-        # Clean up any other temp files
-        for file in os.listdir('.'):
-            if file.startswith('tmp') and file.endswith('.csv'):
-                try:
-                    os.remove(file)
-                except:
-                    pass
+            os.write(fd, content)
+        finally:
+            os.close(fd)
+        self._tmp_paths.add(path)
+        return path
     
     def test_initialization(self):
         """Test proper initialization and data loading"""
         self.assertEqual(len(self.analyzer.data), 4)
-        self.assertIn('total_revenue', self.analyzer.data.columns)
+        self.assertIn('total_revenue', self.cols)
         self.assertEqual(self.analyzer.data['total_revenue'].iloc[0], 200.00)
+        self.assertIsInstance(self.analyzer.data['category'].dtype, pd.CategoricalDtype)
+        self.assertEqual(self.analyzer.data['quantity'].dtype, 'int32')
     
-    def test_top_products_by_revenue(self):
-        """Test top products functionality"""
-        top_products = self.analyzer.top_products_by_revenue(2)
-        self.assertEqual(len(top_products), 2)
-        self.assertEqual(top_products[0][0], 'Test Product D')
-        self.assertEqual(top_products[0][1], 300.00)
+    def test_initialization_from_file_path(self):
+        """Test loading the same data from a CSV file on disk"""
+        file_analyzer = SalesAnalyzer(self._write_temp_csv(_SAMPLE_CSV))
+        self.assertEqual(len(file_analyzer.data), 4)
+        self.assertEqual(file_analyzer.revenue_by_category(), self.analyzer.revenue_by_category())
     
-    def test_revenue_by_category(self):
-        """Test category revenue aggregation"""
-        category_revenue = self.analyzer.revenue_by_category()
-        self.assertIn('Electronics', category_revenue)
-        self.assertIn('Furniture', category_revenue)
-        self.assertEqual(category_revenue['Electronics'], 350.00)
-        self.assertEqual(category_revenue['Furniture'], 500.00)
+    # (method, args, extract, expected): each analysis method is called on
+    # the shared analyzer and extract(result) must equal expected
+    ANALYSIS_CASES = [
+        ('top_products_by_revenue', (2,),
+         lambda r: (len(r), r[0]),
+         (2, ('Test Product D', 300.00))),
+        ('revenue_by_category', (),
+         lambda r: r,
+         {'Electronics': 350.00, 'Furniture': 500.00}),
+        ('daily_sales_performance', (),
+         lambda r: (len(r), ('2024-01-01', 1, 200.00) in r),
+         (4, True)),
+        # Band edges are inclusive on the lower bound: 100.00 is Mid-range
+        ('price_distribution_analysis', (),
+         lambda r: r,
+         {'Budget': [('Electronics', 1)],
+          'Mid-range': [('Electronics', 1), ('Furniture', 2)],
+          'Premium': []}),
+        ('monthly_trend_analysis', (),
+         lambda r: (r, type(r[0][2])),
+         ([('2024-01', 850.00, 7)], int)),
+        ('date_range_analysis', ('2024-01-01', '2024-01-02'),
+         lambda r: (r['filtered_sales'], 'avg_daily_revenue' in r),
+         (2, True)),
+        ('cross_category_insights', (),
+         lambda r: (len(r), len(r[0])),
+         (4, 3)),
+    ]
     
-    def test_daily_sales_performance(self):
-        """Test daily sales performance metrics"""
-        daily_performance = self.analyzer.daily_sales_performance()
-        self.assertEqual(len(daily_performance), 4)
-        dates = [d[0] for d in daily_performance]
-        self.assertIn('2024-01-01', dates)
+    def test_analysis_methods(self):
+        """Test every analysis method against the shared fixture"""
+        for name, args, extract, expected in self.ANALYSIS_CASES:
+            with self.subTest(method=name):
+                result = getattr(self.analyzer, name)(*args)
+                self.assertEqual(extract(result), expected)
     
     def test_regional_analysis(self):
-        """Test regional analysis functionality"""
-        regional_data = self.analyzer.regional_analysis()
-        self.assertEqual(len(regional_data), 4)
-        self.assertIn('North', regional_data)
-        self.assertIn('total_sales', regional_data['North'])
-    
-    def test_price_distribution_analysis(self):
-        """Test price distribution categorization"""
-        price_dist = self.analyzer.price_distribution_analysis()
-        self.assertIn('Budget', price_dist)
-        self.assertIn('Mid-range', price_dist)
-        self.assertIn('Premium', price_dist)
-    
-    def test_monthly_trend_analysis(self):
-        """Test monthly trend calculations"""
-        trends = self.analyzer.monthly_trend_analysis()
-        self.assertEqual(len(trends), 1)
-        self.assertEqual(trends[0][0], '2024-01')
-        self.assertEqual(trends[0][1], 850.00)
+        """Test the shared regional_analysis result"""
+        self.assertEqual(sorted(self.regional), ['East', 'North', 'South', 'West'])
+        self.assertEqual(self.regional['South'],
+                         {'total_sales': 200.00, 'avg_order_value': 200.00,
+                          'product_count': 1, 'top_category': 'Furniture'})
     
     def test_weekly_sales_pattern(self):
-        """Test weekly sales pattern analysis"""
-        weekly_pattern = self.analyzer.weekly_sales_pattern()
-        self.assertIsInstance(weekly_pattern, dict)
-        self.assertGreater(len(weekly_pattern), 0)
-    
-    def test_date_range_analysis(self):
-        """Test date range filtering analysis"""
-        date_analysis = self.analyzer.date_range_analysis('2024-01-01', '2024-01-02')
-        self.assertIn('filtered_sales', date_analysis)
-        self.assertIn('avg_daily_revenue', date_analysis)
-        self.assertEqual(date_analysis['filtered_sales'], 2)
-    
-    def test_cross_category_insights(self):
-        """Test cross-category analysis"""
-        insights = self.analyzer.cross_category_insights()
-        self.assertEqual(len(insights), 4)
-        self.assertTrue(all(len(insight) == 3 for insight in insights))
-    
-    def test_empty_data_handling(self):
-        """Test handling of empty CSV data"""
-        empty_data = "product_id,product_name,category,price,quantity,sales_date,region\n"
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(empty_data)
-            f.flush()
-            empty_analyzer = SalesAnalyzer(f.name)
-            
-            self.assertEqual(len(empty_analyzer.data), 0)
-            self.assertEqual(empty_analyzer.top_products_by_revenue(), [])
-            self.assertEqual(empty_analyzer.revenue_by_category(), {})
-            
-            os.remove(f.name)
-    
-    def test_single_product_analysis(self):
-        """Test analysis with single product"""
-        single_data = """product_id,product_name,category,price,quantity,sales_date,region
-1,Single Product,Electronics,100.00,1,2024-01-01,North"""
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(single_data)
-            f.flush()
-            single_analyzer = SalesAnalyzer(f.name)
-            
-            top_products = single_analyzer.top_products_by_revenue(5)
-            self.assertEqual(len(top_products), 1)
-            self.assertEqual(top_products[0][1], 100.00)
-            
-            os.remove(f.name)
+        """Test the shared weekly_sales_pattern result"""
+        self.assertEqual(self.weekly, {'Monday': 200.00, 'Tuesday': 200.00,
+                                       'Wednesday': 150.00, 'Thursday': 300.00})
     
     def test_lambda_expressions_functionality(self):
         """Test lambda expressions in price distribution"""
@@ -169,55 +175,74 @@ class TestSalesAnalyzer(unittest.TestCase):
         self.assertTrue(all(isinstance(item, tuple) and len(item) == 2 for item in top_products))
         
         # Test functional composition in regional analysis
-        regional_data = self.analyzer.regional_analysis()
-        for region, metrics in regional_data.items():
+        for region, metrics in self.regional.items():
             self.assertIn('total_sales', metrics)
             self.assertIn('avg_order_value', metrics)
             self.assertIn('top_category', metrics)
     
     def test_functional_aggregation_correctness(self):
         """Test mathematical correctness of functional aggregations"""
-        # Verify revenue calculations
-        category_revenue = self.analyzer.revenue_by_category()
-        
-        # Electronics: (100*2) + (50*3) = 200 + 150 = 350
-        # Furniture: (200*1) + (300*1) = 200 + 300 = 500
-        self.assertEqual(category_revenue['Electronics'], 350.00)
-        self.assertEqual(category_revenue['Furniture'], 500.00)
+        # Verify revenue calculations against the precomputed oracle
+        self.assertEqual(self.analyzer.revenue_by_category(), self.expected_cat)
         
         # Verify total revenue matches sum of categories
-        total_expected = 350.00 + 500.00
-        actual_total = sum(category_revenue.values())
-        self.assertEqual(actual_total, total_expected)
+        self.assertEqual(self.analyzer.data['total_revenue'].sum(), sum(self.expected_cat.values()))
     
     def test_date_range_analysis_edge_cases(self):
         """Test date range analysis with various edge cases"""
-        # Test with no date filters
-        all_data = self.analyzer.date_range_analysis()
-        self.assertEqual(all_data['filtered_sales'], 4)
+        # (start_date, end_date) windows: none, start only, end only, no matches
+        windows = [(None, None), ('2024-01-02', None), (None, '2024-01-02'),
+                   ('2025-01-01', '2025-01-31')]
+        results = [self.analyzer.date_range_analysis(start, end) for start, end in windows]
+        self.assertEqual([r['filtered_sales'] for r in results], [4, 3, 2, 0])
         
-        # Test with start date only
-        start_only = self.analyzer.date_range_analysis(start_date='2024-01-02')
-        self.assertEqual(start_only['filtered_sales'], 3)
-        
-        # Test with end date only
-        end_only = self.analyzer.date_range_analysis(end_date='2024-01-02')
-        self.assertEqual(end_only['filtered_sales'], 2)
-        
-        # Test with date range that returns no results
-        no_results = self.analyzer.date_range_analysis('2025-01-01', '2025-01-31')
-        self.assertEqual(no_results['filtered_sales'], 0)
+        no_results = results[-1]
         self.assertEqual(no_results['avg_daily_revenue'], 0.0)
         self.assertIsNone(no_results['peak_day'])
+
+
+class TestSalesAnalyzerEdge(unittest.TestCase):
+    """Edge cases that build their own analyzer or run main()"""
+    
+    def test_empty_data_handling(self):
+        """Test handling of empty CSV data"""
+        empty_data = "product_id,product_name,category,price,quantity,sales_date,region\n"
+        empty_analyzer = SalesAnalyzer(io.StringIO(empty_data))
+        
+        self.assertEqual(len(empty_analyzer.data), 0)
+        self.assertEqual(empty_analyzer.top_products_by_revenue(), [])
+        self.assertEqual(empty_analyzer.revenue_by_category(), {})
+    
+    def test_single_product_analysis(self):
+        """Test analysis with single product"""
+        single_data = """product_id,product_name,category,price,quantity,sales_date,region
+1,Single Product,Electronics,100.00,1,2024-01-01,North"""
+        
+        single_analyzer = SalesAnalyzer(io.StringIO(single_data))
+        
+        top_products = single_analyzer.top_products_by_revenue(5)
+        self.assertEqual(len(top_products), 1)
+        self.assertEqual(top_products[0][1], 100.00)
+    
+    def test_price_distribution_band_edges(self):
+        """Test prices just below and at each band edge"""
+        edge_data = """product_id,product_name,category,price,quantity,sales_date,region
+1,Edge A,Electronics,99.99,1,2024-01-01,North
+2,Edge B,Electronics,100.00,1,2024-01-01,North
+3,Edge C,Furniture,499.99,1,2024-01-01,North
+4,Edge D,Furniture,500.00,1,2024-01-01,North"""
+        
+        price_dist = SalesAnalyzer(io.StringIO(edge_data)).price_distribution_analysis()
+        self.assertEqual(price_dist, {'Budget': [('Electronics', 1)],
+                                      'Mid-range': [('Electronics', 1), ('Furniture', 1)],
+                                      'Premium': [('Furniture', 1)]})
     
     def test_main_execution_coverage(self):
         """Test main function execution for coverage"""
-        import sys
-        from io import StringIO
-        
-        # Capture stdout to test main execution
+        # Capture stdout to test main execution; the checked headers are
+        # printed first, so a capped buffer is enough
         old_stdout = sys.stdout
-        sys.stdout = StringIO()
+        sys.stdout = _CappedIO()
         
         try:
             # Import and execute main function
@@ -233,52 +258,22 @@ class TestSalesAnalyzer(unittest.TestCase):
     
     def test_empty_data_initialization_edge_case(self):
         """Test initialization with completely empty CSV file"""
-        import pandas as pd
-        
         # Test with pandas EmptyDataError
-        empty_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-        empty_file.write('')  # Completely empty file
-        empty_file.close()
-        
-        try:
-            analyzer = SalesAnalyzer(empty_file.name)
-            self.assertEqual(len(analyzer.data), 0)
-            # Test all methods return appropriate empty results
-            self.assertEqual(analyzer.top_products_by_revenue(), [])
-            self.assertEqual(analyzer.revenue_by_category(), {})
-            self.assertEqual(analyzer.daily_sales_performance(), [])
-            self.assertEqual(analyzer.regional_analysis(), {})
-            self.assertEqual(analyzer.monthly_trend_analysis(), [])
-            self.assertEqual(analyzer.weekly_sales_pattern(), {})
-            self.assertEqual(analyzer.cross_category_insights(), [])
-        finally:
-            os.remove(empty_file.name)
+        analyzer = SalesAnalyzer(io.StringIO(''))  # Completely empty file
+        self.assertEqual(len(analyzer.data), 0)
+        # Test all methods return appropriate empty results
+        self.assertEqual(analyzer.top_products_by_revenue(), [])
+        self.assertEqual(analyzer.revenue_by_category(), {})
+        self.assertEqual(analyzer.daily_sales_performance(), [])
+        self.assertEqual(analyzer.regional_analysis(), {})
+        self.assertEqual(analyzer.monthly_trend_analysis(), [])
+        self.assertEqual(analyzer.weekly_sales_pattern(), {})
+        self.assertEqual(analyzer.cross_category_insights(), [])
     
     def test_file_not_found_initialization(self):
         """Test initialization with non-existent file"""
         with self.assertRaises(FileNotFoundError):
             SalesAnalyzer('nonexistent_file.csv')
-    
-    def test_main_function_with_wrong_path(self):
-        """Test main function execution path coverage"""
-        # This will test the main() function path that tries to load from hardcoded path
-        import sys
-        from io import StringIO
-        
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        
-        try:
-            # This should handle the case where the hardcoded path doesn't exist
-            from sales_analyzer import main
-            # The main function has a hardcoded path that won't exist in test environment
-            # This will test the error handling path
-            main()
-        except:
-            # Expected to fail due to hardcoded path
-            pass
-        finally:
-            sys.stdout = old_stdout
 
 
 if __name__ == '__main__':